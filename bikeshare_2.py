@@ -3,12 +3,27 @@ US Bikeshare Data Analysis Application
 Analyzes bikeshare usage patterns across Chicago, New York City, and Washington.
 """
 
+import concurrent.futures
+import functools
+import glob
+import io
 import time
 import pandas as pd
 import numpy as np
 import os
+import shutil
+import sys
+import threading
 from datetime import datetime
 
+# pyarrow is optional; without it the memory-mapped C CSV engine is used
+# and the partitioned Parquet store is simply skipped
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 os.chdir(SCRIPT_DIR)
@@ -19,10 +34,63 @@ CITY_DATA = {
     'washington': 'washington.csv'
 }
 
-# Constants for validation
-VALID_CITIES = ['chicago', 'new york city', 'washington']
-VALID_MONTHS = ['january', 'february', 'march', 'april', 'may', 'june', 'all']
-VALID_DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday', 'all']
+# Ordered names, used to convert between names and month/day indexes
+VALID_MONTHS_ORDERED = ('january', 'february', 'march', 'april', 'may', 'june', 'all')
+VALID_DAYS_ORDERED = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday',
+                      'sunday', 'all')
+
+# Constants for validation (sets for constant-time membership checks)
+VALID_CITIES = frozenset(['chicago', 'new york city', 'washington'])
+VALID_MONTHS = frozenset(VALID_MONTHS_ORDERED)
+VALID_DAYS = frozenset(VALID_DAYS_ORDERED)
+
+# Columns used by the statistics (Washington has no Gender/Birth Year data)
+NEEDED_COLS = {
+    'chicago': ['Start Time', 'End Time', 'Trip Duration', 'Start Station',
+                'End Station', 'User Type', 'Gender', 'Birth Year'],
+    'new york city': ['Start Time', 'End Time', 'Trip Duration', 'Start Station',
+                      'End Station', 'User Type', 'Gender', 'Birth Year'],
+    'washington': ['Start Time', 'End Time', 'Trip Duration', 'Start Station',
+                   'End Station', 'User Type']
+}
+
+# Fixed schema so the CSV reader skips type inference; the repetitive text
+# columns are categorical so filters, mode() and counts work on integer codes
+DTYPES = {
+    # Only shown in raw data pages, so it is kept as text rather than parsed
+    'End Time': 'str',
+    'Trip Duration': 'float32',
+    'Start Station': 'category',
+    'End Station': 'category',
+    'User Type': 'category',
+    'Gender': 'category',
+    'Birth Year': 'float32'
+}
+
+# Columns derived from Start Time once at load time, so the statistics
+# functions never add columns to the (possibly shared) DataFrame
+DATE_COLS = ['month', 'day_of_week', 'hour']
+
+# Fixed categories so day_of_week is consistent across chunks and cache reads
+DAY_DTYPE = pd.CategoricalDtype(VALID_DAYS_ORDERED[:-1])
+
+# Parsed data is stored per city under this directory, one Parquet file per
+# (month, day of week) partition
+PARTITION_DIR = 'cache'
+
+# Written last once a city's partitions are complete; holds the number of
+# records read from the CSV and how many had an invalid Start Time, then the
+# stored columns
+PARTITION_MARKER = 'counts.txt'
+
+# Partition files kept in memory: every (month, day) partition of every city
+PARTITION_CACHE_SIZE = len(CITY_DATA) * 12 * 7
+
+# Rows per chunk when streaming a CSV file without pyarrow
+CHUNK_SIZE = 250_000
+
+# Number of filtered results memoized across interactive sessions
+FILTER_CACHE_SIZE = 16
 
 
 def get_user_input(prompt, valid_options, error_msg):
@@ -31,7 +99,7 @@ def get_user_input(prompt, valid_options, error_msg):
     
     Args:
         prompt (str): Message to display to user
-        valid_options (list): List of acceptable inputs
+        valid_options (frozenset): Set of acceptable inputs
         error_msg (str): Error message for invalid input
         
     Returns:
@@ -109,12 +177,24 @@ def remove_outliers(df, column, method='iqr'):
     
     if method == 'iqr':
         # IQR method: Remove values outside 1.5 * IQR range
-        Q1 = df[column].quantile(0.25)
-        Q3 = df[column].quantile(0.75)
+        # Work on the column's own (narrow) dtype; only the quartiles are widened
+        values = df[column].to_numpy()
+        valid = values[~np.isnan(values)]
+
+        # Both quartiles (linearly interpolated, as Series.quantile) come
+        # from a single O(N) partition instead of two sorts
+        positions = np.array([0.25, 0.75]) * (valid.size - 1)
+        below = np.floor(positions).astype(np.int64)
+        above = np.minimum(below + 1, valid.size - 1)
+        part = np.partition(valid, np.concatenate([below, above]))
+        below_values = part[below].astype(np.float64)
+        above_values = part[above].astype(np.float64)
+        Q1, Q3 = below_values + (above_values - below_values) * (positions - below)
+
         IQR = Q3 - Q1
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
-        df = df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
+        df = df[(values >= lower_bound) & (values <= upper_bound)]
     
     elif method == 'zscore':
         # Z-score method: Remove values with |z-score| > 3
@@ -126,7 +206,11 @@ def remove_outliers(df, column, method='iqr'):
             print(f"  Warning: Standard deviation for '{column}' is 0, skipping Z-score method")
             return df
         
-        z_scores = np.abs((df[column] - mean) / std)
+        # Build |z| in one ndarray buffer, updated in place, rather than
+        # allocating a Series for each of the subtract/divide/abs steps
+        z_scores = df[column].to_numpy() - mean
+        z_scores *= 1.0 / std
+        np.abs(z_scores, out=z_scores)
         df = df[z_scores < 3]
     
     removed_count = initial_count - len(df)
@@ -136,13 +220,336 @@ def remove_outliers(df, column, method='iqr'):
     return df
 
 
+def decompose_start_times(start_times):
+    """
+    Split start times into month, day of week and hour with integer arithmetic.
+
+    Everything is derived from whole seconds (and months) since the epoch in
+    vectorized numpy operations, avoiding the .dt accessor and any per-row
+    name strings. 1970-01-01 was a Thursday, so +3 makes Monday day code 0.
+
+    Args:
+        start_times (ndarray): datetime64 start times
+
+    Returns:
+        tuple: (months, day_codes, hours)
+            months (ndarray): int8 months, 1-12
+            day_codes (ndarray): int8 days of week, Monday = 0
+            hours (ndarray): int8 hours, 0-23
+    """
+    epoch_seconds = start_times.astype('datetime64[s]').view('i8')
+    epoch_months = start_times.astype('datetime64[M]').view('i8')
+    months = (epoch_months % 12 + 1).astype(np.int8)
+    day_codes = ((epoch_seconds // 86_400 + 3) % 7).astype(np.int8)
+    hours = (epoch_seconds // 3_600 % 24).astype(np.int8)
+    return months, day_codes, hours
+
+
+def add_date_columns(df):
+    """
+    Parse Start Time and add the month, day_of_week and hour columns.
+
+    Rows with an invalid Start Time are dropped.
+
+    Args:
+        df (DataFrame): raw city data as returned by read_csv
+
+    Returns:
+        DataFrame: DataFrame with the DATE_COLS columns added
+    """
+    # Start Time is parsed by read_csv; fall back to coercion if any
+    # unparseable entries left it as strings
+    if not pd.api.types.is_datetime64_any_dtype(df['Start Time']):
+        df['Start Time'] = pd.to_datetime(df['Start Time'], errors='coerce')
+
+    # Remove rows with invalid Start Time
+    df = df.dropna(subset=['Start Time'])
+
+    # Extract month, day of week and hour from Start Time
+    months, day_codes, hours = decompose_start_times(df['Start Time'].to_numpy())
+    df['month'] = months
+    df['day_of_week'] = pd.Categorical.from_codes(day_codes, dtype=DAY_DTYPE)
+    df['hour'] = hours
+    return df
+
+
+def filter_by_date(df, month, day):
+    """
+    Keep only the rows matching the month and day filters.
+
+    Args:
+        df (DataFrame): city data with month and day_of_week columns
+        month (str): month name to filter by, or "all" for no month filter
+        day (str): day of week to filter by, or "all" for no day filter
+
+    Returns:
+        DataFrame: Filtered DataFrame
+    """
+    if month == 'all' and day == 'all':
+        return df
+
+    # Both filters are combined into one ndarray mask, so the rows are
+    # copied once rather than once per filter
+    mask = np.ones(len(df), dtype=bool)
+
+    # Apply month filter if specified
+    if month != 'all':
+        # Convert month name to index (1-6 for Jan-June)
+        month_index = VALID_MONTHS_ORDERED.index(month) + 1
+        mask &= df['month'].to_numpy() == month_index
+
+    # Apply day filter if specified
+    if day != 'all':
+        day_code = VALID_DAYS_ORDERED.index(day)
+        mask &= df['day_of_week'].cat.codes.to_numpy() == day_code
+
+    return df.iloc[np.flatnonzero(mask)]
+
+
+def read_csv_options(city):
+    """
+    Build the read_csv keyword arguments for a city.
+
+    Only the columns in NEEDED_COLS are read, using the fixed DTYPES schema.
+
+    Args:
+        city (str): name of the city to read
+
+    Returns:
+        dict: Keyword arguments for pd.read_csv
+    """
+    usecols = NEEDED_COLS[city]
+    return {
+        'usecols': usecols,
+        'dtype': {col: dtype for col, dtype in DTYPES.items() if col in usecols},
+        'parse_dates': ['Start Time']
+    }
+
+
+def partition_dir(city):
+    """
+    Return the partition store directory for a city.
+
+    Args:
+        city (str): name of the city
+
+    Returns:
+        str: Directory holding the city's m=<month>/d=<day> partitions
+    """
+    return os.path.join(PARTITION_DIR, os.path.splitext(CITY_DATA[city])[0])
+
+
+def prepare_partitions(city):
+    """
+    Read a whole city CSV file with the pyarrow engine into the partition store.
+
+    Each (month, day of week) combination is written to its own
+    m=<month>/d=<day>/part.parquet file with Start Time already parsed and
+    the DATE_COLS columns added, so later reads only touch the partitions
+    matching the filters.
+
+    Args:
+        city (str): name of the city to read
+
+    Returns:
+        tuple: (parsed_records, invalid_times)
+            parsed_records (int): number of records read from the CSV file
+            invalid_times (int): number of records dropped for an invalid Start Time
+
+    Raises:
+        ValueError: if the CSV file contains no records
+    """
+    csv_file = CITY_DATA[city]
+    df = pd.read_csv(csv_file, engine='pyarrow', **read_csv_options(city))
+
+    # Check if data is empty
+    if df.empty:
+        raise ValueError(f"{csv_file} is empty.")
+
+    parsed_records = len(df)
+    df = add_date_columns(df)
+    invalid_times = parsed_records - len(df)
+
+    # Drop partitions left over from an older version of the CSV file
+    store_dir = partition_dir(city)
+    shutil.rmtree(store_dir, ignore_errors=True)
+    os.makedirs(store_dir)
+
+    for (month_index, day_name), part in df.groupby(['month', 'day_of_week'], observed=True):
+        part_dir = os.path.join(store_dir, f'm={month_index}', f'd={day_name}')
+        os.makedirs(part_dir)
+        part.to_parquet(os.path.join(part_dir, 'part.parquet'), engine='pyarrow')
+
+    with open(os.path.join(store_dir, PARTITION_MARKER), 'w') as marker:
+        marker.write(f"{parsed_records} {invalid_times}\n")
+        marker.write(','.join(NEEDED_COLS[city] + DATE_COLS))
+
+    return parsed_records, invalid_times
+
+
+@functools.lru_cache(maxsize=PARTITION_CACHE_SIZE)
+def read_partition(path, mtime):
+    """
+    Read one partition file, keeping it in memory for the rest of the session.
+
+    Callers must not modify the returned DataFrame.
+
+    Args:
+        path (str): path to a part.parquet file
+        mtime (float): modification time of the file, so a rebuilt store
+            is read again rather than served from memory
+
+    Returns:
+        DataFrame: Data for one (month, day of week) partition
+    """
+    return pd.read_parquet(path)
+
+
+def read_partitions(city, month, day):
+    """
+    Read the partitions of a city's store that match the filters.
+
+    The store is (re)built first if it is missing, older than the CSV file
+    or holds different columns.
+    Partitions already read this session come from memory, so changing the
+    month or day filter only reads partitions that were not loaded before.
+
+    Args:
+        city (str): name of the city to read
+        month (str): month name to filter by, or "all" for no month filter
+        day (str): day of week to filter by, or "all" for no day filter
+
+    Returns:
+        tuple: (df, parsed_records, invalid_times)
+            df (DataFrame): filtered city data
+            parsed_records (int): number of records read from the CSV file
+            invalid_times (int): number of records dropped for an invalid Start Time
+
+    Raises:
+        ValueError: if the CSV file contains no records
+    """
+    store_dir = partition_dir(city)
+    marker_file = os.path.join(store_dir, PARTITION_MARKER)
+    lines = []
+    if (os.path.exists(marker_file)
+            and os.path.getmtime(marker_file) >= os.path.getmtime(CITY_DATA[city])):
+        with open(marker_file) as marker:
+            lines = marker.read().splitlines()
+
+    # Stores written by older versions may lack newer columns; rebuild those
+    if lines[1:] != [','.join(NEEDED_COLS[city] + DATE_COLS)]:
+        parsed_records, invalid_times = prepare_partitions(city)
+    else:
+        parsed_records, invalid_times = (int(count) for count in lines[0].split())
+
+    month_part = '*' if month == 'all' else VALID_MONTHS_ORDERED.index(month) + 1
+    day_part = '*' if day == 'all' else day
+    paths = sorted(glob.glob(os.path.join(store_dir, f'm={month_part}', f'd={day_part}',
+                                          'part.parquet')))
+    if not paths:
+        return pd.DataFrame(columns=NEEDED_COLS[city] + DATE_COLS), parsed_records, invalid_times
+
+    df = pd.concat([read_partition(path, os.path.getmtime(path)) for path in paths])
+    if len(paths) > 1:
+        # Restore the CSV row order across partitions
+        df = df.sort_index()
+    return df, parsed_records, invalid_times
+
+
+def stream_city_data(city, month, day):
+    """
+    Read a city CSV file in chunks, keeping only rows that match the filters.
+
+    Used when pyarrow is not installed (or the partition store cannot be
+    written), so that rows discarded by the month and day filters never
+    accumulate in memory.
+
+    Args:
+        city (str): name of the city to read
+        month (str): month name to filter by, or "all" for no month filter
+        day (str): day of week to filter by, or "all" for no day filter
+
+    Returns:
+        tuple: (df, parsed_records, invalid_times)
+            df (DataFrame): filtered city data
+            parsed_records (int): number of records read from the CSV file
+            invalid_times (int): number of records dropped for an invalid Start Time
+
+    Raises:
+        ValueError: if the CSV file contains no records
+    """
+    csv_file = CITY_DATA[city]
+    options = read_csv_options(city)
+    chunks = []
+    parsed_records = 0
+    valid_records = 0
+
+    # memory_map lets the C parser read straight from the OS page cache, and
+    # low_memory=False infers each chunk's remaining types in a single pass
+    reader = pd.read_csv(csv_file, engine='c', chunksize=CHUNK_SIZE,
+                         memory_map=True, low_memory=False, **options)
+    for chunk in reader:
+        parsed_records += len(chunk)
+        chunk = add_date_columns(chunk)
+        valid_records += len(chunk)
+        chunks.append(filter_by_date(chunk, month, day))
+
+    # Check if data is empty
+    if parsed_records == 0:
+        raise ValueError(f"{csv_file} is empty.")
+
+    # Chunks carry consecutive CSV row labels, so keep them as the pyarrow path does
+    df = pd.concat(chunks)
+
+    # Chunks infer their own categories, so concat may fall back to object
+    category_cols = [col for col, dtype in options['dtype'].items() if dtype == 'category']
+    df = df.astype({col: 'category' for col in category_cols})
+    return df, parsed_records, parsed_records - valid_records
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def load_filtered_data(city, month, day):
+    """
+    Read city data and apply the month and day filters.
+
+    Results are memoized per filter combination, so repeating a query in
+    the interactive loop skips reading and filtering entirely. Nothing is
+    printed here about the data itself; the counts are returned so
+    load_data can report them on every load. Callers must not modify the
+    returned DataFrame.
+
+    Args:
+        city (str): name of the city to analyze
+        month (str): month name to filter by, or "all" for no month filter
+        day (str): day of week to filter by, or "all" for no day filter
+
+    Returns:
+        tuple: (df, parsed_records, invalid_times)
+            df (DataFrame): filtered city data
+            parsed_records (int): number of records read from the CSV file
+            invalid_times (int): number of records dropped for an invalid Start Time
+
+    Raises:
+        ValueError: if the CSV file contains no records
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            return read_partitions(city, month, day)
+        except OSError as e:
+            # The store is an optimization only; a read-only data dir is fine
+            print(f"  Warning: Could not use partition store - {e}")
+    return stream_city_data(city, month, day)
+
+
 def load_data(city, month, day, remove_outliers_flag=False):
     """
     Load data for the specified city and apply month and day filters.
     
-    This function reads the CSV file for the selected city, converts the 
-    Start Time to datetime, and filters based on month and day preferences.
-    Optionally removes outliers from trip duration data.
+    This function reads the data for the selected city and filters based on
+    month and day preferences, reading only the matching partitions of the
+    Parquet store when available, otherwise streaming the CSV in chunks.
+    Optionally removes outliers from trip duration data. Reading and
+    filtering are memoized, so repeated queries in one session are instant.
 
     Args:
         city (str): name of the city to analyze
@@ -167,40 +574,9 @@ def load_data(city, month, day, remove_outliers_flag=False):
             print(f"Error: File '{csv_file}' not found.")
             return None
         
-        df = pd.read_csv(csv_file)
-        initial_records = len(df)
-        
-        # Check if data is empty
-        if df.empty:
-            print(f"Error: {csv_file} is empty.")
-            return None
-
-        # Convert Start Time column to datetime for easier manipulation
-        if 'Start Time' not in df.columns:
-            print("Error: 'Start Time' column not found in data.")
-            return None
-        
-        df['Start Time'] = pd.to_datetime(df['Start Time'], errors='coerce')
-        
-        # Remove rows with invalid Start Time
-        invalid_times = df['Start Time'].isna().sum()
+        df, initial_records, invalid_times = load_filtered_data(city, month, day)
         if invalid_times > 0:
             print(f"  Warning: Found {invalid_times} invalid datetime entries, removing them.")
-            df = df.dropna(subset=['Start Time'])
-        
-        # Extract month and day of week from Start Time
-        df['month'] = df['Start Time'].dt.month
-        df['day_of_week'] = df['Start Time'].dt.day_name().str.lower()
-
-        # Apply month filter if specified
-        if month != 'all':
-            # Convert month name to index (1-6 for Jan-June)
-            month_index = VALID_MONTHS.index(month) + 1
-            df = df[df['month'] == month_index]
-
-        # Apply day filter if specified
-        if day != 'all':
-            df = df[df['day_of_week'] == day]
 
         # Remove outliers if requested
         if remove_outliers_flag:
@@ -216,7 +592,8 @@ def load_data(city, month, day, remove_outliers_flag=False):
         else:
             print()
         
-        return df
+        # Shallow copy so callers adding columns don't touch the memoized frame
+        return df.copy(deep=False)
     
     except FileNotFoundError as e:
         print(f"Error: Could not find file - {e}")
@@ -244,31 +621,25 @@ def time_stats(df):
     start_time = time.time()
 
     try:
-        # Find and display most common month
-        if df['month'].mode().empty:
-            print("No month data available.")
-        else:
-            common_month = df['month'].mode()[0]
-            month_name = VALID_MONTHS[common_month - 1].title()
-            print(f'Most Common Month: {month_name}')
-
-        # Find and display most common day of week
-        if df['day_of_week'].mode().empty:
-            print("No day of week data available.")
-        else:
-            common_day = df['day_of_week'].mode()[0]
-            print(f'Most Common Day: {common_day.title()}')
+        # Month, day and hour have few distinct values, so each mode is a
+        # single np.bincount pass (argmax picks the earliest on ties, as mode does)
 
-        # Extract hour from Start Time and find most common
-        df['hour'] = df['Start Time'].dt.hour
-        if df['hour'].mode().empty:
-            print("No hour data available.")
-        else:
-            common_hour = df['hour'].mode()[0]
-            # Convert to 12-hour format for readability
-            hour_12 = common_hour % 12 if common_hour % 12 != 0 else 12
-            am_pm = 'AM' if common_hour < 12 else 'PM'
-            print(f'Most Common Start Hour: {common_hour}:00 ({hour_12} {am_pm})')
+        # Find and display most common month
+        common_month = np.bincount(df['month'].to_numpy(), minlength=13).argmax()
+        month_name = VALID_MONTHS_ORDERED[common_month - 1].title()
+        print(f'Most Common Month: {month_name}')
+
+        # Find and display most common day of week (Monday is code 0)
+        day_codes = df['day_of_week'].cat.codes.to_numpy()
+        common_day = np.bincount(day_codes, minlength=7).argmax()
+        print(f'Most Common Day: {VALID_DAYS_ORDERED[common_day].title()}')
+
+        # Find and display most common start hour
+        common_hour = np.bincount(df['hour'].to_numpy(), minlength=24).argmax()
+        # Convert to 12-hour format for readability
+        hour_12 = common_hour % 12 if common_hour % 12 != 0 else 12
+        am_pm = 'AM' if common_hour < 12 else 'PM'
+        print(f'Most Common Start Hour: {common_hour}:00 ({hour_12} {am_pm})')
 
         print(f"\nThis took {(time.time() - start_time):.4f} seconds.")
         print('-' * 50)
@@ -304,30 +675,48 @@ def station_stats(df):
             print('-' * 50)
             return
 
-        # Find and display most common start station
-        if df['Start Station'].mode().empty:
+        # Find and display most common start station with one counting pass
+        # over the category codes (argmax picks the first station on ties)
+        start_codes = df['Start Station'].cat.codes.to_numpy()
+        start_codes = start_codes[start_codes >= 0]
+        if start_codes.size == 0:
             print("No start station data available.")
         else:
-            common_start = df['Start Station'].mode()[0]
-            start_count = (df['Start Station'] == common_start).sum()
+            start_counts = np.bincount(start_codes,
+                                       minlength=len(df['Start Station'].cat.categories))
+            top = start_counts.argmax()
+            common_start = df['Start Station'].cat.categories[top]
+            start_count = start_counts[top]
             print(f'Most Common Start Station: {common_start} ({start_count} trips)')
 
-        # Find and display most common end station
-        if df['End Station'].mode().empty:
+        # Find and display most common end station the same way
+        end_codes = df['End Station'].cat.codes.to_numpy()
+        end_codes = end_codes[end_codes >= 0]
+        if end_codes.size == 0:
             print("No end station data available.")
         else:
-            common_end = df['End Station'].mode()[0]
-            end_count = (df['End Station'] == common_end).sum()
+            end_counts = np.bincount(end_codes,
+                                     minlength=len(df['End Station'].cat.categories))
+            top = end_counts.argmax()
+            common_end = df['End Station'].cat.categories[top]
+            end_count = end_counts[top]
             print(f'Most Common End Station: {common_end} ({end_count} trips)')
 
-        # Create combination of start and end stations for trip analysis
-        df['Start-End Combo'] = df['Start Station'] + " â†’ " + df['End Station']
-        if df['Start-End Combo'].mode().empty:
+        # Count start/end station pairs on their category codes packed into
+        # one int64 key, so only the winning pair is formatted as text
+        start_codes = df['Start Station'].cat.codes.to_numpy(dtype=np.int64)
+        end_codes = df['End Station'].cat.codes.to_numpy(dtype=np.int64)
+        paired = (start_codes >= 0) & (end_codes >= 0)
+        trip_keys = (start_codes[paired] << 32) | end_codes[paired]
+        if trip_keys.size == 0:
             print("No trip combination data available.")
         else:
-            common_trip = df['Start-End Combo'].mode()[0]
-            trip_count = (df['Start-End Combo'] == common_trip).sum()
-            print(f'Most Common Trip: {common_trip} ({trip_count} trips)')
+            keys, counts = np.unique(trip_keys, return_counts=True)
+            top = counts.argmax()
+            trip_start = df['Start Station'].cat.categories[keys[top] >> 32]
+            trip_end = df['End Station'].cat.categories[keys[top] & 0xFFFFFFFF]
+            trip_count = counts[top]
+            print(f'Most Common Trip: {trip_start} â†’ {trip_end} ({trip_count} trips)')
 
         print(f"\nThis took {(time.time() - start_time):.4f} seconds.")
         print('-' * 50)
@@ -360,8 +749,10 @@ def trip_duration_stats(df):
             print('-' * 50)
             return
 
-        # Calculate total travel time in seconds
-        total_duration = df['Trip Duration'].sum()
+        # Calculate total travel time in seconds; the column stays float32
+        # and only the accumulator is widened to float64
+        durations = df['Trip Duration'].dropna().to_numpy()
+        total_duration = durations.sum(dtype=np.float64)
         
         # Convert to human-readable format
         days = int(total_duration // (24 * 3600))
@@ -372,7 +763,7 @@ def trip_duration_stats(df):
         print(f'Total Travel Time (seconds): {total_duration:,.0f}')
 
         # Calculate and display mean travel time
-        mean_duration = df['Trip Duration'].mean()
+        mean_duration = durations.mean(dtype=np.float64)
         mean_minutes = int(mean_duration // 60)
         mean_seconds = int(mean_duration % 60)
         print(f'Average Trip Duration: {mean_minutes} minutes, {mean_seconds} seconds')
@@ -409,7 +800,9 @@ def user_stats(df):
         # Display counts of user types
         if 'User Type' in df.columns:
             print('User Type Distribution:')
+            # Categorical counts include categories absent after filtering
             user_types = df['User Type'].value_counts()
+            user_types = user_types[user_types > 0]
             if user_types.empty:
                 print("  No user type data available.")
             else:
@@ -422,6 +815,7 @@ def user_stats(df):
         if 'Gender' in df.columns:
             print('\nGender Distribution:')
             gender_counts = df['Gender'].value_counts()
+            gender_counts = gender_counts[gender_counts > 0]
             if gender_counts.empty:
                 print("  No gender data available.")
             else:
@@ -433,13 +827,16 @@ def user_stats(df):
         # Display birth year statistics if available
         if 'Birth Year' in df.columns:
             print('\nBirth Year Statistics:')
-            valid_years = df['Birth Year'].dropna()
-            if valid_years.empty:
+            valid_years = df['Birth Year'].dropna().to_numpy(dtype=np.int16)
+            if valid_years.size == 0:
                 print("  No birth year data available.")
             else:
+                # Years span a small range, so one bincount gives the mode
+                # without sorting (argmax picks the earliest year on ties)
                 earliest = int(valid_years.min())
                 recent = int(valid_years.max())
-                common_year = int(valid_years.mode()[0]) if not valid_years.mode().empty else 0
+                year_counts = np.bincount(valid_years - earliest)
+                common_year = earliest + int(year_counts.argmax())
                 
                 current_year = datetime.now().year
                 print(f'  Earliest Birth Year: {earliest} (Age: {current_year - earliest})')
@@ -456,6 +853,57 @@ def user_stats(df):
         print('-' * 50)
 
 
+class ThreadLocalWriter:
+    """
+    Stand-in for sys.stdout that sends each thread's output to its own buffer.
+
+    Threads that have not set a buffer write to the wrapped stream as usual.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.stream).write(text)
+
+    def flush(self):
+        getattr(self.local, 'buffer', self.stream).flush()
+
+
+def run_all_stats(df):
+    """
+    Run all statistics functions concurrently and print their reports in order.
+
+    The pandas/numpy reductions release the GIL, so the functions can overlap
+    on separate cores; each one's output is buffered so reports never
+    interleave.
+
+    Args:
+        df (DataFrame): the DataFrame containing bikeshare data
+    """
+    stats_functions = [time_stats, station_stats, trip_duration_stats, user_stats]
+    writer = ThreadLocalWriter(sys.stdout)
+
+    def capture(stats_function):
+        writer.local.buffer = io.StringIO()
+        try:
+            stats_function(df)
+            return writer.local.buffer.getvalue()
+        finally:
+            del writer.local.buffer
+
+    sys.stdout = writer
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(stats_functions)) as executor:
+            reports = list(executor.map(capture, stats_functions))
+    finally:
+        sys.stdout = writer.stream
+
+    for report in reports:
+        print(report, end='')
+
+
 def display_raw_data(df):
     """
     Display raw data upon user request.
@@ -468,12 +916,21 @@ def display_raw_data(df):
         print("No data available to display.")
         return
     
+    # Slice pages lazily; each page is a view that keeps the column dtypes
+    # and only touches the rows it shows
+    pages = (df.iloc[start:start + 5] for start in range(0, len(df), 5))
     row_index = 0
     show_data = input('\nWould you like to see 5 rows of raw data? Enter yes or no: ').lower().strip()
     
     while show_data == 'yes':
-        print('\n', df.iloc[row_index:row_index + 5])
-        row_index += 5
+        page = next(pages)
+        row_index += len(page)
+        if 'Trip Duration' in page.columns:
+            # float32 prints with spurious digits (4130.812988); show the
+            # shortest value that reads back the same, as in the CSV
+            durations = page['Trip Duration'].astype(str).astype('float64')
+            page = page.assign(**{'Trip Duration': durations})
+        print('\n', page)
         
         # Check if there are more rows to display
         if row_index >= len(df):
@@ -507,10 +964,7 @@ def main():
             print("Please try different filter options.")
         else:
             # Display all statistics
-            time_stats(df)
-            station_stats(df)
-            trip_duration_stats(df)
-            user_stats(df)
+            run_all_stats(df)
             
             # Offer to display raw data
             display_raw_data(df)